@@ -55,7 +55,16 @@ MIGRATION_DATES = {
 # Customize output file locations and naming conventions
 OUTPUT_DIR = "output"
 CSV_FILENAME = "zera_unified_price_history.csv"  # Change for different tokens
+PARQUET_FILENAME = "zera_unified_price_history.parquet"  # Change for different tokens
 CHART_FILENAME = "zera_price_chart.png"  # Change for different tokens
+CHART_DPI = 150  # Web resolution; raise to 300 for print-quality charts
+
+# API Cache Configuration
+# Each pool's API response is cached on disk and reused until it expires,
+# so repeated runs during development skip the network entirely.
+CACHE_DIR = f"{OUTPUT_DIR}/cache"
+CACHE_TTL_SECONDS = 3600  # Refetch pool data older than 1 hour; 0 disables the cache
+CACHE_REFRESH = False  # Skip reading cached responses, but still write fresh ones (--refresh)
 
 # To track a different token:
 # 1. Update POOLS with new pool addresses and migration dates
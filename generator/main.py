@@ -16,8 +16,15 @@ Configure pool addresses and migration dates in config.py to track different tok
 import os
 import sys
 import argparse
+import pickle
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+# Charts are only ever written to PNG here - use the non-interactive Agg
+# backend (unless the caller chose one) so no GUI toolkit is initialized
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
 # Import our modules
 import config
 from src.zera_tracker import (
@@ -26,13 +33,17 @@ from src.zera_tracker import (
     interpolate_migration_gaps,
     add_migration_markers,
     get_summary_stats,
-    print_summary,
-    create_price_chart,
-    create_comparison_chart
+    print_summary
 )
 
 
-def main(use_cache: bool = False):
+def _render_chart(chart_func, df_bytes: bytes, output_path: str, kwargs: dict):
+    """Worker entry point: unpickle the shared DataFrame and draw one chart"""
+    chart_func(pickle.loads(df_bytes), output_path, **kwargs)
+    return output_path
+
+
+def main(use_cache: bool = False, export_parquet: bool = True, generate_charts: bool = True):
     """Main execution function"""
     print("="*70)
     print("TOKEN MIGRATION TRACKER")
@@ -82,6 +93,9 @@ def main(use_cache: bool = False):
     try:
         os.makedirs(config.OUTPUT_DIR, exist_ok=True)
         csv_path = f"{config.OUTPUT_DIR}/{config.CSV_FILENAME}"
+        # Always pandas: pyarrow's CSV writer quotes strings and formats
+        # booleans and dates differently, and the file must not depend on
+        # which libraries are installed
         df.to_csv(csv_path, index=False)
         print(f"✓ Data exported to: {csv_path}")
         print(f"  Total rows: {len(df)}")
@@ -89,6 +103,21 @@ def main(use_cache: bool = False):
     except Exception as e:
         print(f"\n✗ Error exporting CSV: {e}")
 
+    # Typed, columnar copy of the same data for fast reloads (e.g. check_prices.py)
+    parquet_path = f"{config.OUTPUT_DIR}/{config.PARQUET_FILENAME}"
+    parquet_error = None
+    if export_parquet:
+        try:
+            df.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+            print(f"✓ Data exported to: {parquet_path}")
+        except Exception as e:
+            parquet_error = e
+            print(f"\n✗ Error exporting Parquet: {e}")
+    if (not export_parquet or parquet_error) and os.path.exists(parquet_path):
+        # check_prices.py prefers Parquet, so don't leave a stale copy beside the fresh CSV
+        os.remove(parquet_path)
+        print(f"✓ Removed stale Parquet export: {parquet_path}")
+
     # Step 5: Generate visualizations
     print("\n[5/5] Generating visualizations...")
     print("-" * 70)
@@ -98,21 +127,40 @@ def main(use_cache: bool = False):
     chart_price_only_path = f"{config.OUTPUT_DIR}/zera_price_chart_large.png"
     comparison_path = f"{config.OUTPUT_DIR}/zera_comparison_chart.png"
 
-    try:
-        # Main price chart with volume
-        create_price_chart(df, chart_path, include_volume=True)
-
-        # Large price chart without volume
-        create_price_chart(df, chart_price_only_path, include_volume=False)
-
-        # Comparison chart
-        create_comparison_chart(df, comparison_path)
-
-        print("✓ Visualizations completed")
-    except Exception as e:
-        print(f"\n✗ Error generating charts: {e}")
-        import traceback
-        traceback.print_exc()
+    if not generate_charts:
+        print("✓ Skipped (--no-charts)")
+    else:
+        # Imported here so CSV-only runs never load the plotting stack
+        from src.zera_tracker.visualizer import create_price_chart, create_comparison_chart
+
+        chart_jobs = [
+            # Main price chart with volume
+            (create_price_chart, chart_path, {'include_volume': True}),
+            # Large price chart without volume, kept at print resolution
+            (create_price_chart, chart_price_only_path, {'include_volume': False, 'dpi': 300}),
+            # Comparison chart
+            (create_comparison_chart, comparison_path, {}),
+        ]
+
+        try:
+            # The charts are independent, so each renders in its own process.
+            # The DataFrame is pickled once; on Linux, fork lets the workers
+            # reuse the already-imported pandas/matplotlib modules (macOS and
+            # Windows keep their default spawn start method)
+            df_bytes = pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL)
+            mp_context = (multiprocessing.get_context('fork')
+                          if sys.platform.startswith('linux') else None)
+            with ProcessPoolExecutor(max_workers=len(chart_jobs), mp_context=mp_context) as executor:
+                futures = [executor.submit(_render_chart, chart_func, df_bytes, output_path, kwargs)
+                           for chart_func, output_path, kwargs in chart_jobs]
+                for future in futures:
+                    future.result()
+
+            print("✓ Visualizations completed")
+        except Exception as e:
+            print(f"\n✗ Error generating charts: {e}")
+            import traceback
+            traceback.print_exc()
 
     # Final summary
     print("\n" + "="*70)
@@ -123,9 +171,14 @@ def main(use_cache: bool = False):
     print(f"✓ To:   {stats['end_date']}")
     print(f"\nGenerated files:")
     print(f"  📊 {csv_path}")
-    print(f"  📈 {chart_path}")
-    print(f"  📈 {chart_price_only_path} (large, price only)")
-    print(f"  📊 {comparison_path}")
+    if parquet_error:
+        print(f"  ✗ {parquet_path} (export failed: {parquet_error})")
+    elif export_parquet:
+        print(f"  📊 {parquet_path}")
+    if generate_charts:
+        print(f"  📈 {chart_path}")
+        print(f"  📈 {chart_price_only_path} (large, price only)")
+        print(f"  📊 {comparison_path}")
     print("\n" + "="*70)
     print(f"Completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("="*70 + "\n")
@@ -138,10 +191,21 @@ if __name__ == "__main__":
     )
     parser.add_argument('--cache', action='store_true',
                        help='Use cached API data instead of fetching from GeckoTerminal')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Ignore the per-pool response cache and refetch every pool')
+    parser.add_argument('--no-parquet', action='store_true',
+                       help='Skip the Parquet export and write only the CSV')
+    parser.add_argument('--no-charts', action='store_true',
+                       help='Skip chart generation (and the matplotlib import)')
     args = parser.parse_args()
 
+    if args.refresh:
+        # Refetch every pool, but still rewrite the on-disk response cache
+        config.CACHE_REFRESH = True
+
     try:
-        main(use_cache=args.cache)
+        main(use_cache=args.cache, export_parquet=not args.no_parquet,
+             generate_charts=not args.no_charts)
     except KeyboardInterrupt:
         print("\n\nProcess interrupted by user. Exiting...")
         sys.exit(0)
@@ -1,24 +1,38 @@
+import os
 import pandas as pd
 
-df = pd.read_csv('output/zera_unified_price_history.csv')
-real_df = df[df['is_interpolated'] == False]
+PARQUET_PATH = 'output/zera_unified_price_history.parquet'
+CSV_PATH = 'output/zera_unified_price_history.csv'
+COLUMNS = ['close', 'pool_name', 'is_interpolated']
+
+# Only load the columns this check needs - from Parquet when main.py wrote it
+if os.path.exists(PARQUET_PATH):
+    df = pd.read_parquet(PARQUET_PATH, columns=COLUMNS)
+else:
+    df = pd.read_csv(
+        CSV_PATH,
+        usecols=COLUMNS,
+        dtype={'close': 'float64', 'pool_name': 'category', 'is_interpolated': 'bool'}
+    )
+real_df = df[~df['is_interpolated']]
+
+# One pass over the real rows for every pool's price stats
+stats = real_df.groupby('pool_name', observed=True, sort=False)['close'].agg(mean='mean', max='max', last='last')
 
 print('M0N3Y (Original Pool):')
-mon3y = real_df[real_df['pool_name']=='mon3y']
-print(f'  Average price: ${mon3y["close"].mean():.6f}')
-print(f'  Max price: ${mon3y["close"].max():.6f}')
+if 'mon3y' in stats.index:
+    print(f'  Average price: ${stats.loc["mon3y", "mean"]:.6f}')
+    print(f'  Max price: ${stats.loc["mon3y", "max"]:.6f}')
 
 print('\nZERA Raydium:')
-Raydium = real_df[real_df['pool_name']=='zera_Raydium']
-if len(Raydium) > 0:
-    print(f'  Average price: ${Raydium["close"].mean():.6f}')
-    print(f'  Max price: ${Raydium["close"].max():.6f}')
+if 'zera_Raydium' in stats.index:
+    print(f'  Average price: ${stats.loc["zera_Raydium", "mean"]:.6f}')
+    print(f'  Max price: ${stats.loc["zera_Raydium", "max"]:.6f}')
 
 print('\nZERA Meteora:')
-Meteora = real_df[real_df['pool_name']=='zera_Meteora']
-if len(Meteora) > 0:
-    print(f'  Average price: ${Meteora["close"].mean():.6f}')
-    print(f'  Current price: ${Meteora["close"].iloc[-1]:.6f}')
+if 'zera_Meteora' in stats.index:
+    print(f'  Average price: ${stats.loc["zera_Meteora", "mean"]:.6f}')
+    print(f'  Current price: ${stats.loc["zera_Meteora", "last"]:.6f}')
 
 print('\n' + '='*60)
 print('If these are USD values, the axis labels need updating!')
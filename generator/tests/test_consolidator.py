@@ -0,0 +1,53 @@
+"""
+Tests for the data consolidator
+"""
+
+import numpy as np
+
+import config
+from zera_tracker.consolidator import create_unified_dataframe, interpolate_migration_gaps
+
+DAY = 86400
+MIGRATION = 1759363200  # October 2, 2025 00:00:00 UTC
+GAP_START = MIGRATION - 2 * DAY  # September 30, 2025 00:00:00 UTC
+GAP_END = MIGRATION + DAY  # October 3, 2025 00:00:00 UTC
+
+
+def _pool(address, symbol, candles):
+    return {
+        'info': {'address': address, 'token_symbol': symbol},
+        'data': {'data': {'attributes': {'ohlcv_list': candles}}},
+    }
+
+
+def test_interpolation_ignores_other_pool_at_gap_edge(monkeypatch):
+    monkeypatch.setattr(config, 'MIGRATION_DATES', {'mon3y_to_zera': MIGRATION})
+
+    # Both pools have a candle on the timestamp that closes the gap
+    df = create_unified_dataframe({
+        'mon3y': _pool('addr_mon3y', 'M0N3Y', [
+            [GAP_START, 1.0, 1.0, 1.0, 1.0, 100.0],
+            [GAP_END, 1.11, 1.11, 1.11, 1.11, 100.0],
+        ]),
+        'zera_Raydium': _pool('addr_raydium', 'ZERA', [
+            [GAP_END, 5.0, 5.0, 5.0, 5.0, 100.0],
+        ]),
+    })
+    df = interpolate_migration_gaps(df)
+
+    interp = df[df['is_interpolated']].sort_values('timestamp')
+    assert len(interp) == 12
+
+    # The gap is bounded by the real rows its label names
+    label = interp['pool_name'].iloc[0]
+    before_pool, after_pool = label.split('_to_')
+    assert before_pool == 'mon3y'
+    real = df[~df['is_interpolated']]
+    after_close = real.loc[
+        (real['timestamp'] == GAP_END) & (real['pool_name'] == after_pool), 'close'
+    ].item()
+
+    closes = interp['close'].to_numpy()
+    expected = 1.0 + np.arange(1, 13) / 12 * (after_close - 1.0)
+    np.testing.assert_allclose(closes, expected)
+    assert closes[-1] == after_close
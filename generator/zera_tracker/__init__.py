@@ -14,7 +14,6 @@ from .consolidator import (
     get_summary_stats,
     print_summary
 )
-from .visualizer import create_price_chart, create_comparison_chart
 
 __all__ = [
     'fetch_all_pools',
@@ -26,3 +25,11 @@ __all__ = [
     'create_price_chart',
     'create_comparison_chart',
 ]
+
+
+def __getattr__(name):
+    """Load the chart functions on first access, so importing the package skips matplotlib"""
+    if name in ('create_price_chart', 'create_comparison_chart'):
+        from . import visualizer
+        return getattr(visualizer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,12 @@
+"""
+Optional numba support - kernels run as plain Python when numba is missing
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, usable with or without arguments"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
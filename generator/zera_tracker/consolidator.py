@@ -2,11 +2,66 @@
 Data consolidator - merges M0N3Y and ZERA pool data into unified timeline
 """
 
+import numpy as np
 import pandas as pd
-from datetime import datetime
 from typing import Dict, List
 import config
 from .fetcher import parse_ohlcv_data
+from ._jit import njit
+
+# Low-cardinality string columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ('pool_name', 'pool_address', 'token_symbol')
+
+# Display label for each migration, keyed by its UTC day number
+MIGRATION_LABELS = {
+    timestamp // 86400: event_name.replace('_', ' ').title()
+    for event_name, timestamp in config.MIGRATION_DATES.items()
+}
+
+
+def _to_datetime_ns(timestamps: np.ndarray) -> np.ndarray:
+    """
+    Convert unix seconds to naive UTC datetime64[ns], the unit every date column uses
+
+    Args:
+        timestamps: Int64 unix timestamps in seconds
+
+    Returns:
+        datetime64[ns] array, so consumers can take int64 views of the dates
+    """
+    return np.asarray(timestamps, dtype=np.int64).astype('datetime64[s]').astype('datetime64[ns]')
+
+
+def _build_pool_frame(ohlcv: np.ndarray, metadata: Dict[str, str],
+                      categories: Dict[str, List[str]]) -> pd.DataFrame:
+    """
+    Build one pool's DataFrame from its parsed OHLCV array
+
+    Args:
+        ohlcv: (N, 6) array from parse_ohlcv_data
+        metadata: Per-pool values for each categorical column
+        categories: Shared categories for each categorical column
+
+    Returns:
+        DataFrame for a single pool
+    """
+    timestamps = ohlcv[:, 0].astype('int64')
+
+    # Typed record array -> DataFrame, so no per-column dtype inference is needed
+    pool_df = pd.DataFrame.from_records(np.rec.fromarrays(
+        [timestamps, ohlcv[:, 1], ohlcv[:, 2], ohlcv[:, 3], ohlcv[:, 4], ohlcv[:, 5]],
+        names='timestamp,open,high,low,close,volume'
+    ))
+    pool_df.insert(1, 'date', _to_datetime_ns(timestamps))
+
+    # Broadcast the pool's metadata as categorical codes, never as per-row strings
+    for col in CATEGORICAL_COLUMNS:
+        code = categories[col].index(metadata[col])
+        pool_df[col] = pd.Categorical.from_codes(
+            np.full(len(pool_df), code), categories=categories[col]
+        )
+
+    return pool_df
 
 
 def create_unified_dataframe(all_pool_data: Dict) -> pd.DataFrame:
@@ -19,7 +74,7 @@ def create_unified_dataframe(all_pool_data: Dict) -> pd.DataFrame:
     Returns:
         Unified pandas DataFrame with complete price history
     """
-    all_records = []
+    pool_metadata = {}
 
     # Process each pool
     for pool_name, pool_data in all_pool_data.items():
@@ -28,25 +83,28 @@ def create_unified_dataframe(all_pool_data: Dict) -> pd.DataFrame:
             continue
 
         pool_info = pool_data['info']
-        ohlcv_list = parse_ohlcv_data(pool_data['data'])
-
-        for entry in ohlcv_list:
-            record = {
-                'timestamp': entry['timestamp'],
-                'date': datetime.fromtimestamp(entry['timestamp']),
-                'open': entry['open'],
-                'high': entry['high'],
-                'low': entry['low'],
-                'close': entry['close'],
-                'volume': entry['volume'],
-                'pool_name': pool_name,
-                'pool_address': pool_info['address'],
-                'token_symbol': pool_info['token_symbol']
-            }
-            all_records.append(record)
-
-    # Create DataFrame
-    df = pd.DataFrame(all_records)
+        pool_metadata[pool_name] = {
+            'pool_name': pool_name,
+            'pool_address': pool_info['address'],
+            'token_symbol': pool_info['token_symbol']
+        }
+
+    if not pool_metadata:
+        raise ValueError("No pool data available to consolidate")
+
+    # Shared categories, so the per-pool categoricals concatenate without
+    # falling back to object dtype
+    categories = {
+        col: sorted({metadata[col] for metadata in pool_metadata.values()})
+        for col in CATEGORICAL_COLUMNS
+    }
+
+    # One frame per pool, concatenated once
+    frames = [
+        _build_pool_frame(parse_ohlcv_data(all_pool_data[pool_name]['data']), metadata, categories)
+        for pool_name, metadata in pool_metadata.items()
+    ]
+    df = pd.concat(frames, ignore_index=True)
 
     # Sort by timestamp
     df = df.sort_values('timestamp').reset_index(drop=True)
@@ -61,6 +119,52 @@ def create_unified_dataframe(all_pool_data: Dict) -> pd.DataFrame:
     return df
 
 
+@njit(cache=True)
+def _interpolate_gaps(ts, migration_ts, hours_per_point):
+    """
+    Find every migration gap and lay out its interpolation timestamps in one compiled pass
+
+    Args:
+        ts: Sorted int64 timestamps of the real rows
+        migration_ts: Int64 migration timestamps
+        hours_per_point: Hours between interpolated points
+
+    Returns:
+        Tuple of (bounds, new_ts, gap_ids), where bounds[m] holds the
+        real-row positions around migration m (-1 if that migration has
+        no gap to fill) and gap_ids maps each new point to its migration
+    """
+    n_migrations = len(migration_ts)
+    interval_seconds = hours_per_point * 3600
+    bounds = np.full((n_migrations, 2), -1, dtype=np.int64)
+    num_points = np.zeros(n_migrations, dtype=np.int64)
+
+    # Pass 1: find the real rows around each migration and size the output
+    for m in range(n_migrations):
+        pos = np.searchsorted(ts, migration_ts[m])
+        if 0 < pos < len(ts):
+            time_gap_hours = (ts[pos] - ts[pos - 1]) / 3600
+            # If gap is > hours_per_point, interpolate
+            if time_gap_hours > hours_per_point:
+                bounds[m, 0] = pos - 1
+                bounds[m, 1] = pos
+                num_points[m] = int(time_gap_hours / hours_per_point)
+
+    total = num_points.sum()
+    new_ts = np.empty(total, dtype=np.int64)
+    gap_ids = np.empty(total, dtype=np.int64)
+
+    # Pass 2: place points at regular intervals across each gap
+    k = 0
+    for m in range(n_migrations):
+        for i in range(1, num_points[m] + 1):
+            new_ts[k] = ts[bounds[m, 0]] + i * interval_seconds
+            gap_ids[k] = m
+            k += 1
+
+    return bounds, new_ts, gap_ids
+
+
 def interpolate_migration_gaps(df: pd.DataFrame, hours_per_point: int = 6) -> pd.DataFrame:
     """
     Interpolate missing data between pool migrations for smooth transitions
@@ -75,69 +179,82 @@ def interpolate_migration_gaps(df: pd.DataFrame, hours_per_point: int = 6) -> pd
     Returns:
         DataFrame with interpolated values at migration points
     """
-    import numpy as np
-
     # Sort by timestamp
     df = df.sort_values('timestamp').reset_index(drop=True)
 
     # Add 'is_interpolated' flag to existing data
     df['is_interpolated'] = False
 
-    # For each migration, check if there's a gap and interpolate
-    for event_name, migration_ts in config.MIGRATION_DATES.items():
-        # Only look at real data (not previously interpolated points) when finding gaps
-        real_data = df[df['is_interpolated'] == False].copy()
-
-        # Find data points around migration
-        before_mask = real_data['timestamp'] < migration_ts
-        after_mask = real_data['timestamp'] >= migration_ts
-
-        if before_mask.any() and after_mask.any():
-            last_before = real_data[before_mask].iloc[-1]
-            first_after = real_data[after_mask].iloc[0]
-
-            # Calculate time gap in hours
-            time_gap_hours = (first_after['timestamp'] - last_before['timestamp']) / 3600
-            time_gap_seconds = first_after['timestamp'] - last_before['timestamp']
+    # Every row is real at this point and df is sorted by timestamp, so gap
+    # boundaries can be found by binary search instead of masking the frame
+    ts = df['timestamp'].to_numpy()
+    close = df['close'].to_numpy(dtype=np.float64)
+    volume = df['volume'].to_numpy(dtype=np.float64)
+    pool_name_arr = df['pool_name'].to_numpy()
+    pool_address_arr = df['pool_address'].to_numpy()
+    token_symbol_arr = df['token_symbol'].to_numpy()
+
+    event_names = list(config.MIGRATION_DATES.keys())
+    bounds, interp_ts, gap_ids = _interpolate_gaps(
+        ts,
+        np.array(list(config.MIGRATION_DATES.values()), dtype=np.int64),
+        hours_per_point
+    )
+
+    # Per-migration metadata for the generated points
+    pool_names = []
+    pool_addresses = []
+    token_symbols = []
+    for gap, event_name in enumerate(event_names):
+        before, after = bounds[gap]
+        if before < 0:
+            pool_names.append('')
+            pool_addresses.append('')
+            token_symbols.append('')
+            continue
 
-            # If gap is > hours_per_point, interpolate
-            if time_gap_hours > hours_per_point:
-                print(f"  Interpolating {time_gap_hours:.1f}h gap at {event_name}")
-
-                # Create interpolated points at regular intervals
-                num_points = int(time_gap_hours / hours_per_point)
-                interval_seconds = hours_per_point * 3600
-
-                for i in range(1, num_points + 1):
-                    ratio = (i * interval_seconds) / time_gap_seconds
-                    interp_ts = last_before['timestamp'] + (i * interval_seconds)
-
-                    # Linear interpolation of price
-                    interp_price = last_before['close'] + ratio * (first_after['close'] - last_before['close'])
-
-                    # Interpolate volume as well (gradually taper to 0 at midpoint, then back up)
-                    volume_ratio = 1 - (2 * abs(ratio - 0.5))  # Creates a valley at midpoint
-                    interp_volume = (last_before['volume'] + first_after['volume']) * volume_ratio * 0.3
-
-                    new_row = {
-                        'timestamp': int(interp_ts),
-                        'date': datetime.fromtimestamp(interp_ts),
-                        'open': interp_price,
-                        'high': interp_price * 1.001,  # Add slight variation
-                        'low': interp_price * 0.999,
-                        'close': interp_price,
-                        'volume': interp_volume,
-                        'pool_name': f'{last_before["pool_name"]}_to_{first_after["pool_name"]}',
-                        'pool_address': last_before['pool_address'],
-                        'token_symbol': last_before['token_symbol'],
-                        'price_change': 0,
-                        'price_change_pct': 0,
-                        'is_interpolated': True
-                    }
-
-                    df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-
-                print(f"    Added {num_points} interpolated points ({hours_per_point}h intervals)")
+        time_gap_hours = (ts[after] - ts[before]) / 3600
+        print(f"  Interpolating {time_gap_hours:.1f}h gap at {event_name}")
+
+        pool_names.append(f'{pool_name_arr[before]}_to_{pool_name_arr[after]}')
+        pool_addresses.append(pool_address_arr[before])
+        token_symbols.append(token_symbol_arr[before])
+
+        print(f"    Added {np.count_nonzero(gap_ids == gap)} interpolated points ({hours_per_point}h intervals)")
+
+    if len(interp_ts):
+        # Linear interpolation of price between the two real rows bounding each
+        # gap. Not np.interp: the last point lands exactly on the after-row's
+        # timestamp, which another pool's candle may share
+        gap_before = bounds[gap_ids, 0]
+        gap_after = bounds[gap_ids, 1]
+        ratio = (interp_ts - ts[gap_before]) / (ts[gap_after] - ts[gap_before])
+        interp_price = close[gap_before] + ratio * (close[gap_after] - close[gap_before])
+
+        # Interpolate volume as well (gradually taper to 0 at midpoint, then back up)
+        volume_ratio = 1 - (2 * np.abs(ratio - 0.5))  # Creates a valley at midpoint
+        interp_volume = (volume[gap_before] + volume[gap_after]) * volume_ratio * 0.3
+
+        interp_df = pd.DataFrame({
+            'timestamp': interp_ts,
+            'date': _to_datetime_ns(interp_ts),
+            'open': interp_price,
+            'high': interp_price * 1.001,  # Add slight variation
+            'low': interp_price * 0.999,
+            'close': interp_price,
+            'volume': interp_volume,
+            'pool_name': np.array(pool_names, dtype=object)[gap_ids],
+            'pool_address': np.array(pool_addresses, dtype=object)[gap_ids],
+            'token_symbol': np.array(token_symbols, dtype=object)[gap_ids],
+            'price_change': 0.0,
+            'price_change_pct': 0.0,
+            'is_interpolated': True
+        })
+
+        df = pd.concat([df, interp_df], ignore_index=True)
+        # Concatenating with the new transition pool names falls back to object dtype
+        for col in CATEGORICAL_COLUMNS:
+            df[col] = df[col].astype('category')
 
     # Re-sort after adding interpolated points
     df = df.sort_values('timestamp').reset_index(drop=True)
@@ -157,11 +274,12 @@ def add_migration_markers(df: pd.DataFrame) -> pd.DataFrame:
     """
     df['migration_event'] = None
 
+    # Compare whole UTC days as integers instead of building date objects per row
+    days = df['timestamp'].to_numpy() // 86400
+
     # Mark migration dates
-    for event_name, timestamp in config.MIGRATION_DATES.items():
-        migration_date = datetime.fromtimestamp(timestamp).date()
-        mask = df['date'].dt.date == migration_date
-        df.loc[mask, 'migration_event'] = event_name.replace('_', ' ').title()
+    for migration_day, label in MIGRATION_LABELS.items():
+        df.loc[days == migration_day, 'migration_event'] = label
 
     return df
 
@@ -176,22 +294,33 @@ def get_summary_stats(df: pd.DataFrame) -> Dict:
     Returns:
         Dictionary of summary statistics
     """
+    close = df['close'].to_numpy()
+    start_price, end_price = close[0], close[-1]
+    pool_counts = df['pool_name'].value_counts()
+
+    # All column reductions in a single aggregation call
+    agg = df.agg({
+        'date': ['min', 'max'],
+        'high': 'max',
+        'low': 'min',
+        'volume': ['sum', 'mean']
+    })
+
     stats = {
         'total_days': len(df),
-        'start_date': df['date'].min(),
-        'end_date': df['date'].max(),
-        'start_price': df.iloc[0]['close'],
-        'end_price': df.iloc[-1]['close'],
-        'total_change': df.iloc[-1]['close'] - df.iloc[0]['close'],
-        'total_change_pct': ((df.iloc[-1]['close'] - df.iloc[0]['close']) / df.iloc[0]['close']) * 100,
-        'highest_price': df['high'].max(),
-        'lowest_price': df['low'].min(),
-        'total_volume': df['volume'].sum(),
-        'avg_daily_volume': df['volume'].mean(),
+        'start_date': agg.at['min', 'date'],
+        'end_date': agg.at['max', 'date'],
+        'start_price': start_price,
+        'end_price': end_price,
+        'total_change': end_price - start_price,
+        'total_change_pct': ((end_price - start_price) / start_price) * 100,
+        'highest_price': agg.at['max', 'high'],
+        'lowest_price': agg.at['min', 'low'],
+        'total_volume': agg.at['sum', 'volume'],
+        'avg_daily_volume': agg.at['mean', 'volume'],
         'pools': {
-            'mon3y': len(df[df['pool_name'] == 'mon3y']),
-            'zera_Raydium': len(df[df['pool_name'] == 'zera_Raydium']),
-            'zera_Meteora': len(df[df['pool_name'] == 'zera_Meteora'])
+            pool_name: int(pool_counts.get(pool_name, 0))
+            for pool_name in config.POOLS
         }
     }
 
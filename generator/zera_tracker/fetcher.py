@@ -2,15 +2,119 @@
 Data fetcher for GeckoTerminal API
 """
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import json
 import os
-from typing import Dict, List
+import tempfile
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict
 from datetime import datetime
 import config
 
+try:
+    import orjson
+except ImportError:  # Optional - falls back to the stdlib json module
+    orjson = None
 
+
+# Shared session: keep-alive connections are reused across pool fetches
+# (and across fetch_all_pools' worker threads). Retries stay in
+# fetch_pool_data's own loop, so the adapter makes a single attempt.
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept": "application/json", "Accept-Encoding": "gzip"})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4
+))
+
+
+def json_loads(raw: bytes):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize an object to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def _has_ohlcv_list(data) -> bool:
+    """Check that a pool response carries data.attributes.ohlcv_list"""
+    try:
+        return isinstance(data['data']['attributes']['ohlcv_list'], list)
+    except (KeyError, TypeError):
+        return False
+
+
+def _write_atomic(path: str, payload: bytes):
+    """Write bytes to path via a temp file, so readers never see a partial file"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def disk_cached(func):
+    """
+    Cache pool fetches on disk, keyed on (pool address, timeframe)
+
+    Responses are written to config.CACHE_DIR and reused for
+    config.CACHE_TTL_SECONDS; a TTL of 0 turns the disk cache off.
+    config.CACHE_REFRESH skips reading cached responses but still writes
+    fresh ones. Failed fetches and payloads without an OHLCV list are
+    never cached.
+
+    Args:
+        func: Fetch function taking (pool_address, retries)
+
+    Returns:
+        Wrapped function with the same signature
+    """
+    def cached(pool_address: str, timeframe: str, retries: int) -> Dict:
+        cache_path = os.path.join(config.CACHE_DIR, f"{pool_address}_{timeframe}.json")
+
+        if (config.CACHE_TTL_SECONDS > 0 and not config.CACHE_REFRESH
+                and os.path.exists(cache_path)):
+            age = time.time() - os.path.getmtime(cache_path)
+            if age < config.CACHE_TTL_SECONDS:
+                try:
+                    with open(cache_path, 'rb') as f:
+                        data = json_loads(f.read())
+                    print(f"✓ Using cached data for pool: {pool_address[:8]}... ({age / 60:.0f} min old)")
+                    return data
+                except (OSError, ValueError) as e:
+                    print(f"✗ Error loading pool cache: {e}")
+
+        data = func(pool_address, retries)
+
+        # Only cache real OHLCV payloads, never API error bodies
+        if config.CACHE_TTL_SECONDS > 0 and _has_ohlcv_list(data):
+            _write_atomic(cache_path, json_dumps(data))
+
+        return data
+
+    @functools.wraps(func)
+    def wrapper(pool_address: str, retries: int = 3) -> Dict:
+        return cached(pool_address, config.TIMEFRAME, retries)
+
+    return wrapper
+
+
+@disk_cached
 def fetch_pool_data(pool_address: str, retries: int = 3) -> Dict:
     """
     Fetch OHLCV data for a specific pool from GeckoTerminal API
@@ -23,18 +127,17 @@ def fetch_pool_data(pool_address: str, retries: int = 3) -> Dict:
         Dictionary containing pool data and OHLCV list
     """
     url = f"{config.BASE_URL}/networks/{config.NETWORK}/pools/{pool_address}/ohlcv/{config.TIMEFRAME}"
-    headers = {"Accept": "application/json"}
 
     for attempt in range(retries):
         try:
             print(f"Fetching data for pool: {pool_address[:8]}...")
-            response = requests.get(url, headers=headers, timeout=10)
+            response = _SESSION.get(url, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            data = json_loads(response.content)
             return data
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:  # ValueError: malformed JSON body
             print(f"Attempt {attempt + 1}/{retries} failed: {e}")
             if attempt < retries - 1:
                 time.sleep(2)  # Wait before retry
@@ -52,12 +155,10 @@ def save_cache(data: Dict, cache_path: str):
         data: Dictionary to cache
         cache_path: Path to save cache file
     """
-    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-    with open(cache_path, 'w') as f:
-        json.dump({
-            'cached_at': datetime.now().isoformat(),
-            'data': data
-        }, f, indent=2)
+    _write_atomic(cache_path, json_dumps({
+        'cached_at': datetime.now().isoformat(),
+        'data': data
+    }, indent=True))
     print(f"✓ Data cached to: {cache_path}")
 
 
@@ -75,8 +176,8 @@ def load_cache(cache_path: str) -> Dict:
         return None
 
     try:
-        with open(cache_path, 'r') as f:
-            cache = json.load(f)
+        with open(cache_path, 'rb') as f:
+            cache = json_loads(f.read())
             cached_time = datetime.fromisoformat(cache['cached_at'])
             print(f"✓ Loading cached data from {cached_time.strftime('%Y-%m-%d %H:%M:%S')}")
             return cache['data']
@@ -107,28 +208,32 @@ def fetch_all_pools(use_cache: bool = False, cache_path: str = None) -> Dict[str
         else:
             print("Cache not found, fetching from API...")
 
-    # Fetch from API
-    all_pool_data = {}
-
-    for pool_name, pool_info in config.POOLS.items():
-        print(f"\nFetching {pool_info['name']}...")
-        try:
-            data = fetch_pool_data(pool_info['address'])
-            all_pool_data[pool_name] = {
-                'info': pool_info,
-                'data': data
-            }
-            print(f"✓ Successfully fetched {len(data['data']['attributes']['ohlcv_list'])} data points")
-        except Exception as e:
-            print(f"✗ Error fetching {pool_name}: {e}")
-            all_pool_data[pool_name] = {
-                'info': pool_info,
-                'data': None,
-                'error': str(e)
-            }
-
-        # Be nice to the API
-        time.sleep(1)
+    # Fetch from API - pools are independent, so requests run concurrently
+    # (keep the pool order from config regardless of completion order)
+    all_pool_data = {pool_name: None for pool_name in config.POOLS}
+
+    with ThreadPoolExecutor(max_workers=len(config.POOLS)) as executor:
+        futures = {}
+        for pool_name, pool_info in config.POOLS.items():
+            print(f"\nFetching {pool_info['name']}...")
+            futures[executor.submit(fetch_pool_data, pool_info['address'])] = (pool_name, pool_info)
+
+        for future in as_completed(futures):
+            pool_name, pool_info = futures[future]
+            try:
+                data = future.result()
+                all_pool_data[pool_name] = {
+                    'info': pool_info,
+                    'data': data
+                }
+                print(f"✓ Successfully fetched {len(data['data']['attributes']['ohlcv_list'])} data points for {pool_name}")
+            except Exception as e:
+                print(f"✗ Error fetching {pool_name}: {e}")
+                all_pool_data[pool_name] = {
+                    'info': pool_info,
+                    'data': None,
+                    'error': str(e)
+                }
 
     # Save to cache
     save_cache(all_pool_data, cache_path)
@@ -136,34 +241,23 @@ def fetch_all_pools(use_cache: bool = False, cache_path: str = None) -> Dict[str
     return all_pool_data
 
 
-def parse_ohlcv_data(pool_data: Dict) -> List[Dict]:
+def parse_ohlcv_data(pool_data: Dict) -> np.ndarray:
     """
-    Parse raw OHLCV data into a list of dictionaries
+    Parse raw OHLCV data into a numeric array
 
     Args:
         pool_data: Raw pool data from API
 
     Returns:
-        List of dictionaries with parsed OHLCV data
+        Float64 array of shape (N, 6) with columns
+        timestamp, open, high, low, close, volume
     """
     if not pool_data or 'data' not in pool_data:
-        return []
+        return np.empty((0, 6), dtype=np.float64)
 
     ohlcv_list = pool_data['data']['attributes']['ohlcv_list']
-    parsed_data = []
-
-    for entry in ohlcv_list:
-        timestamp, open_price, high, low, close, volume = entry
-        parsed_data.append({
-            'timestamp': timestamp,
-            'open': open_price,
-            'high': high,
-            'low': low,
-            'close': close,
-            'volume': volume
-        })
 
-    return parsed_data
+    return np.asarray(ohlcv_list, dtype=np.float64).reshape(-1, 6)
 
 
 if __name__ == "__main__":
@@ -175,6 +269,6 @@ if __name__ == "__main__":
         if pool_data.get('data'):
             ohlcv = parse_ohlcv_data(pool_data.get('data'))
             print(f"\n{pool_name}: {len(ohlcv)} data points")
-            if ohlcv:
+            if len(ohlcv):
                 print(f"  First: {ohlcv[0]}")
                 print(f"  Last: {ohlcv[-1]}")
@@ -2,103 +2,283 @@
 Visualizer - creates charts for unified ZERA price history
 """
 
-import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
-from matplotlib.patches import Rectangle
+from matplotlib.collections import LineCollection, PolyCollection
 from matplotlib.lines import Line2D
-from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
-from typing import Dict
 import config
 import os
+from ._jit import njit
+
+NS_PER_HOUR = 3_600_000_000_000
+NS_PER_DAY = 24 * NS_PER_HOUR
+
+# Lossless PNG encoding at a lower zlib level: same pixels, faster savefig
+PNG_SAVE_KWARGS = {'compress_level': 3}
+
+# Migration events as naive UTC datetime64[ns], converted once for every chart
+MIGRATION_DATETIMES = {
+    event_name: np.datetime64(timestamp, 's').astype('datetime64[ns]')
+    for event_name, timestamp in config.MIGRATION_DATES.items()
+}
+
+
+# Color mapping for different pools
+POOL_COLORS = {
+    'mon3y': '#FF6B6B',      # Red for M0N3Y
+    'zera_Raydium': '#4ECDC4', # Teal for ZERA Raydium
+    'zera_Meteora': '#45B7D1'  # Blue for ZERA Meteora
+}
+
+# Comparison chart bar colors, applied in (sorted) pool order
+COMPARISON_BAR_COLORS = ['#FF6B6B', '#4ECDC4', '#45B7D1']
+
+# Simple label mapping
+SIMPLE_LABELS = {
+    'mon3y': 'MON3Y',
+    'zera_Raydium': 'Raydium',
+    'zera_Meteora': 'Meteora'
+}
+
+# Transition label for each migration event, drawn at the top of its line
+# (other events fall back to their name with arrows)
+MIGRATION_TRANSITION_LABELS = {
+    'mon3y_to_zera': 'MON3Y → Raydium',
+    'zera_Raydium_to_Meteora': 'Raydium → Meteora',
+}
+for _event_name in config.MIGRATION_DATES:
+    MIGRATION_TRANSITION_LABELS.setdefault(_event_name, _event_name.replace('_', ' → '))
+
+
+def _dates_ns(dates: pd.Series) -> np.ndarray:
+    """
+    Int64 nanosecond view of a date column (a no-op cast for datetime64[ns] columns)
+
+    Args:
+        dates: Series of naive datetimes
+
+    Returns:
+        Int64 array of nanoseconds since the epoch
+    """
+    return dates.to_numpy(dtype='datetime64[ns]').view(np.int64)
+
+
+def _add_migration_lines(ax, color: str):
+    """
+    Draw every migration as a full-height dashed line in a single collection
+
+    Args:
+        ax: Matplotlib axes object
+        color: Line color
+    """
+    # Like axvline: x in data units, y spanning the axes (0-1) whatever the limits
+    x = mdates.date2num(np.array(list(MIGRATION_DATETIMES.values()), dtype='datetime64[ns]'))
+    segments = np.empty((len(x), 2, 2))
+    segments[:, :, 0] = x[:, None]
+    segments[:, 0, 1] = 0
+    segments[:, 1, 1] = 1
+    ax.add_collection(LineCollection(segments, colors=color, linestyles='--', linewidths=1,
+                                     alpha=0.6, zorder=0, transform=ax.get_xaxis_transform()),
+                      autolim=False)
+
+
+def _real_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Select the real (non-interpolated) rows without copying them
+
+    Frames that did not come straight from the consolidator (e.g. reloaded
+    from CSV) are brought to its dtypes: categorical pool_name and
+    datetime64[ns] dates, so the chart groupbys and date math stay on codes
+    and int64 views.
+
+    Args:
+        df: Unified DataFrame, with or without an 'is_interpolated' column
+
+    Returns:
+        DataFrame of real rows (missing flags count as real)
+    """
+    if 'is_interpolated' in df.columns:
+        is_interp = df['is_interpolated'].to_numpy()
+        if is_interp.dtype != np.bool_:
+            # e.g. object dtype after a merge: NaN/None flags compare unequal to True
+            is_interp = is_interp == True
+        df = df.iloc[~is_interp]
+
+    # Only converts when needed; consolidator output passes through untouched
+    conversions = {}
+    if not isinstance(df['pool_name'].dtype, pd.CategoricalDtype):
+        conversions['pool_name'] = df['pool_name'].astype('category')
+    if df['date'].dtype != 'datetime64[ns]':
+        conversions['date'] = pd.to_datetime(df['date']).astype('datetime64[ns]')
+    return df.assign(**conversions) if conversions else df
 
 
 def plot_candlesticks(ax, df, color='#4ECDC4', alpha=0.8):
     """
     Plot candlestick chart on given axes
 
+    The wick, body and doji collections are rasterized, so vector outputs
+    (PDF/SVG) embed the dense candles as one image while ticks, labels and
+    legend stay vector-crisp.
+
     Args:
         ax: Matplotlib axes object
         df: DataFrame with columns: date, open, high, low, close
         color: Base color for candlesticks
         alpha: Transparency
     """
-    # Calculate candlestick width based on data density
+    # Pull the columns out once; every candle is drawn through three collections
+    date_nums = mdates.date2num(df['date'].to_numpy())  # Days, as matplotlib plots dates
+    opens = df['open'].to_numpy()
+    highs = df['high'].to_numpy()
+    lows = df['low'].to_numpy()
+    closes = df['close'].to_numpy()
+
+    # Calculate candlestick width (in days) based on data density
     if len(df) > 1:
-        avg_timedelta = (df['date'].iloc[-1] - df['date'].iloc[0]) / len(df)
-        candle_width = avg_timedelta * 0.6  # 60% of period for candle body
+        avg_period = (date_nums[-1] - date_nums[0]) / len(df)
+        candle_width = avg_period * 0.6  # 60% of period for candle body
     else:
-        candle_width = timedelta(days=0.6)
-
-    for _, row in df.iterrows():
-        date = row['date']
-        open_price = row['open']
-        high = row['high']
-        low = row['low']
-        close = row['close']
-
-        # Determine if bullish (green) or bearish (red)
-        is_bullish = close >= open_price
-        body_color = '#26a69a' if is_bullish else '#ef5350'  # Green/Red
-
-        # Draw high-low wick (thin line)
-        ax.plot([date, date], [low, high],
-                color=body_color, linewidth=1, alpha=alpha, zorder=1)
-
-        # Draw body (rectangle from open to close)
-        body_height = abs(close - open_price)
-        body_bottom = min(open_price, close)
-
-        if body_height > 0:
-            rect = Rectangle((mdates.date2num(date) - candle_width.total_seconds()/(2*86400), body_bottom),
-                           candle_width.total_seconds()/86400, body_height,
-                           facecolor=body_color, edgecolor=body_color,
-                           alpha=alpha, linewidth=0.5, zorder=2)
-            ax.add_patch(rect)
-        else:
-            # Doji (open == close) - draw thin horizontal line
-            ax.plot([mdates.date2num(date) - candle_width.total_seconds()/(2*86400),
-                    mdates.date2num(date) + candle_width.total_seconds()/(2*86400)],
-                   [close, close], color=body_color, linewidth=1.5, alpha=alpha, zorder=2)
+        candle_width = 0.6
+    half_width = candle_width / 2
+
+    # Determine if bullish (green) or bearish (red)
+    is_bullish = closes >= opens
+    body_colors = np.where(is_bullish, '#26a69a', '#ef5350')  # Green/Red
+
+    # Draw high-low wicks (thin lines)
+    # Segment array is (n, 2 endpoints, xy), filled in place
+    wicks = np.empty((len(date_nums), 2, 2))
+    wicks[:, :, 0] = date_nums[:, None]
+    wicks[:, 0, 1] = lows
+    wicks[:, 1, 1] = highs
+    wick_lines = LineCollection(wicks, colors=body_colors, linewidths=1, alpha=alpha,
+                                capstyle='projecting', zorder=1)
+    # Thousands of tiny candle primitives rasterize far cheaper than vector output
+    wick_lines.set_rasterized(True)
+    ax.add_collection(wick_lines)
+
+    # Draw bodies (rectangles from open to close)
+    body_height = np.abs(closes - opens)
+    body_bottom = np.minimum(opens, closes)
+    has_body = body_height > 0
+
+    if has_body.any():
+        # (n, 4 corners, xy) vertex array - no per-candle Rectangle objects
+        body_x = date_nums[has_body]
+        body_y0 = body_bottom[has_body]
+        body_y1 = body_y0 + body_height[has_body]
+        bodies = np.empty((len(body_x), 4, 2))
+        bodies[:, 0:2, 0] = (body_x - half_width)[:, None]
+        bodies[:, 2:4, 0] = (body_x + half_width)[:, None]
+        bodies[:, [0, 3], 1] = body_y0[:, None]
+        bodies[:, [1, 2], 1] = body_y1[:, None]
+        body_patches = PolyCollection(bodies, facecolors=body_colors[has_body],
+                                      edgecolors=body_colors[has_body],
+                                      alpha=alpha, linewidths=0.5, zorder=2)
+        body_patches.set_rasterized(True)
+        ax.add_collection(body_patches)
+
+    # Doji (open == close) - draw thin horizontal lines
+    if not has_body.all():
+        doji_x = date_nums[~has_body]
+        doji_y = closes[~has_body]
+        dojis = np.empty((len(doji_x), 2, 2))
+        dojis[:, 0, 0] = doji_x - half_width
+        dojis[:, 1, 0] = doji_x + half_width
+        dojis[:, :, 1] = doji_y[:, None]
+        doji_lines = LineCollection(dojis, colors=body_colors[~has_body], linewidths=1.5,
+                                    alpha=alpha, capstyle='projecting', zorder=2)
+        doji_lines.set_rasterized(True)
+        ax.add_collection(doji_lines)
+
+    # Collections don't carry date units or trigger autoscaling like ax.plot does
+    ax.xaxis_date()
+    ax.autoscale_view()
+
+
+def _moving_min(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Minimum of every length-`window` run of values, in O(N) regardless of window
 
+    Splits the array into blocks of `window` and takes running minimums
+    forward (prefix) and backward (suffix) within each block; any run then
+    spans at most two blocks, so its minimum is min(suffix[j], prefix[j + window - 1]).
 
-def find_local_peaks(df: pd.DataFrame, window=5, prominence_threshold=0.1):
+    Args:
+        values: 1-D array
+        window: Run length
+
+    Returns:
+        Array where element j is min(values[j:j + window])
     """
-    Find significant local peaks in the price data
+    n = len(values)
+    pad = -n % window
+    blocks = np.concatenate([values, np.full(pad, np.inf, dtype=values.dtype)]).reshape(-1, window)
+    prefix = np.minimum.accumulate(blocks, axis=1).ravel()
+    suffix = np.minimum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    starts = np.arange(n - window + 1)
+    return np.minimum(suffix[starts], prefix[starts + window - 1])
+
+
+def _local_extrema(values: np.ndarray, window: int, prominence_threshold: float) -> np.ndarray:
+    """
+    Find indices of significant local maxima in a single vectorized pass
+
+    A point is a maximum when it is >= every value within `window` positions
+    on either side; its prominence is how far it rises above the higher of
+    the two neighboring window minimums.
 
     Args:
-        df: DataFrame with 'high' and 'date' columns
+        values: 1-D array of prices
         window: Window size for peak detection
         prominence_threshold: Relative prominence threshold (0-1)
 
     Returns:
-        List of (date, high_price) tuples for peaks
+        Array of indices into values
     """
-    if len(df) < window * 2:
-        return []
-
-    peaks = []
-    highs = df['high'].values
-    dates = df['date'].values
+    n = len(values)
+    if n < window * 2 + 1:
+        return np.empty(0, dtype=np.int64)
 
     # Calculate relative prominence threshold
-    price_range = highs.max() - highs.min()
+    price_range = values.max() - values.min()
     min_prominence = price_range * prominence_threshold
 
-    for i in range(window, len(highs) - window):
-        # Check if current point is higher than neighbors
-        is_peak = all(highs[i] >= highs[i-window:i]) and all(highs[i] >= highs[i+1:i+window+1])
+    # Centered max over [i - window, i + window]; only points equal to it can qualify
+    centered_max = -_moving_min(-values, 2 * window + 1)
+    candidates = np.flatnonzero(values[window:n - window] >= centered_max) + window
+    if len(candidates) == 0:
+        return candidates
+
+    # Element j holds min(values[j:j + window]), giving both neighbor windows
+    window_min = _moving_min(values, window)
+    left_min = window_min[candidates - window]
+    right_min = window_min[candidates + 1]
+    prominence = values[candidates] - np.maximum(left_min, right_min)
+
+    return candidates[prominence >= min_prominence]
+
 
-        if is_peak:
-            # Check prominence (how much higher than surrounding area)
-            left_min = min(highs[max(0, i-window):i])
-            right_min = min(highs[i+1:min(len(highs), i+window+1)])
-            prominence = highs[i] - max(left_min, right_min)
+def find_local_peaks(df: pd.DataFrame, window=5, prominence_threshold=0.1):
+    """
+    Find significant local peaks in the price data
 
-            if prominence >= min_prominence:
-                peaks.append((dates[i], highs[i]))
+    Args:
+        df: DataFrame with 'high' and 'date' columns
+        window: Window size for peak detection
+        prominence_threshold: Relative prominence threshold (0-1)
 
-    return peaks
+    Returns:
+        List of (date, high_price) tuples for peaks
+    """
+    highs = df['high'].to_numpy()
+    dates = df['date'].to_numpy()
+
+    idx = _local_extrema(highs, window, prominence_threshold)
+    return list(zip(dates[idx], highs[idx]))
 
 
 def find_local_troughs(df: pd.DataFrame, window=5, prominence_threshold=0.1):
@@ -113,31 +293,44 @@ def find_local_troughs(df: pd.DataFrame, window=5, prominence_threshold=0.1):
     Returns:
         List of (date, low_price) tuples for troughs
     """
-    if len(df) < window * 2:
-        return []
+    lows = df['low'].to_numpy()
+    dates = df['date'].to_numpy()
 
-    troughs = []
-    lows = df['low'].values
-    dates = df['date'].values
+    # Troughs of the lows are the peaks of the negated lows
+    idx = _local_extrema(-lows, window, prominence_threshold)
+    return list(zip(dates[idx], lows[idx]))
 
-    # Calculate relative prominence threshold
-    price_range = lows.max() - lows.min()
-    min_prominence = price_range * prominence_threshold
 
-    for i in range(window, len(lows) - window):
-        # Check if current point is lower than neighbors
-        is_trough = all(lows[i] <= lows[i-window:i]) and all(lows[i] <= lows[i+1:i+window+1])
+@njit(cache=True)
+def _min_distance_kernel(ts_ns, values, min_distance_days):
+    """
+    Sweep date-sorted points, keeping the more extreme of any pair that is too close
+
+    Args:
+        ts_ns: Sorted int64 timestamps in nanoseconds
+        values: Float64 point values
+        min_distance_days: Minimum days between kept points
+
+    Returns:
+        Int64 array of indices of the kept points
+    """
+    keep = np.empty(len(ts_ns), dtype=np.int64)
+    keep[0] = 0  # Always keep the first point
+    k = 1
 
-        if is_trough:
-            # Check prominence (how much lower than surrounding area)
-            left_max = max(lows[max(0, i-window):i])
-            right_max = max(lows[i+1:min(len(lows), i+window+1)])
-            prominence = min(left_max, right_max) - lows[i]
+    for i in range(1, len(ts_ns)):
+        last = keep[k - 1]
+        time_diff = (ts_ns[i] - ts_ns[last]) / NS_PER_DAY
 
-            if prominence >= min_prominence:
-                troughs.append((dates[i], lows[i]))
+        if time_diff >= min_distance_days:
+            # Far enough away, keep this point
+            keep[k] = i
+            k += 1
+        elif abs(values[i]) > abs(values[last]):
+            # Too close, keep the more extreme value (further from zero)
+            keep[k - 1] = i
 
-    return troughs
+    return keep[:k]
 
 
 def filter_by_minimum_distance(points, min_distance_days=5):
@@ -155,33 +348,48 @@ def filter_by_minimum_distance(points, min_distance_days=5):
     if len(points) <= 1:
         return points
 
-    # Sort by date
-    sorted_points = sorted(points, key=lambda x: x[0])
-    filtered = [sorted_points[0]]  # Always keep the first point
+    # Sort by date (stable, like sorted())
+    ts_ns = np.array([point[0] for point in points], dtype='datetime64[ns]').view(np.int64)
+    order = np.argsort(ts_ns, kind='stable')
+    values = np.array([point[1] for point in points], dtype=np.float64)[order]
 
-    for current_point in sorted_points[1:]:
-        current_date = current_point[0]
-        current_value = current_point[1]
+    keep = _min_distance_kernel(ts_ns[order], values, float(min_distance_days))
+    return [points[i] for i in order[keep]]
 
-        last_point = filtered[-1]
-        last_date = last_point[0]
-        last_value = last_point[1]
 
-        # Convert timedelta to days (handles both numpy and pandas timedelta)
-        time_diff = pd.Timedelta(current_date - last_date).total_seconds() / 86400
+def _pool_markers(pool_df: pd.DataFrame, peak_window: int, min_distance_days: float):
+    """
+    Find one pool's filtered peak/trough markers (pure computation, no plotting)
 
-        if time_diff >= min_distance_days:
-            # Far enough away, keep this point
-            filtered.append(current_point)
-        else:
-            # Too close, keep the more extreme value (further from zero)
-            if abs(current_value) > abs(last_value):
-                filtered[-1] = current_point
+    Args:
+        pool_df: Real, date-sorted rows of a single pool
+        peak_window: Window size for peak/trough detection
+        min_distance_days: Minimum days between kept markers
+
+    Returns:
+        List of (date, value, 'peak' | 'trough') tuples
+    """
+    # Too short for a full window on both sides: no extremum can qualify
+    if len(pool_df) <= 2 * peak_window:
+        return []
+
+    # Find peaks and troughs using adaptive window
+    peaks = find_local_peaks(pool_df, window=peak_window, prominence_threshold=0.25)
+    troughs = find_local_troughs(pool_df, window=peak_window, prominence_threshold=0.25)
+
+    # Combine peaks and troughs with type markers
+    all_markers = []
+    for date, value in peaks:
+        all_markers.append((date, value, 'peak'))
+    for date, value in troughs:
+        all_markers.append((date, value, 'trough'))
 
-    return filtered
+    # Filter combined list to prevent overlaps using adaptive distance
+    return filter_by_minimum_distance(all_markers, min_distance_days=min_distance_days)
 
 
-def create_price_chart(df: pd.DataFrame, output_path: str = None, include_volume: bool = True):
+def create_price_chart(df: pd.DataFrame, output_path: str = None, include_volume: bool = True,
+                       dpi: int = None):
     """
     Create a comprehensive price chart with migration markers
 
@@ -189,12 +397,24 @@ def create_price_chart(df: pd.DataFrame, output_path: str = None, include_volume
         df: Unified DataFrame with price history
         output_path: Path to save the chart (optional)
         include_volume: Whether to include volume subplot (default: True)
+        dpi: Resolution of the saved chart (default: config.CHART_DPI)
     """
-    # Calculate adaptive parameters based on timeframe
-    real_df_temp = df[~df.get('is_interpolated', False)].copy()
-    if len(real_df_temp) > 1:
-        avg_time_delta = (real_df_temp['date'].iloc[-1] - real_df_temp['date'].iloc[0]) / len(real_df_temp)
-        avg_hours = avg_time_delta.total_seconds() / 3600
+    # Real (non-interpolated) rows, date-sorted - selected once and reused below
+    real_df = _real_rows(df)
+    if real_df.empty:
+        # Nothing to chart - skip figure construction entirely
+        print("Warning: No real data points to chart, skipping price chart")
+        return
+    if not real_df['date'].is_monotonic_increasing:
+        real_df = real_df.sort_values('date', kind='stable')
+
+    # Calculate adaptive parameters based on timeframe (only the dates are needed,
+    # as int64 nanoseconds)
+    real_dates_ns = _dates_ns(real_df['date'])
+    if len(real_dates_ns) > 1:
+        avg_period_ns = (real_dates_ns[-1] - real_dates_ns[0]) // len(real_dates_ns)
+        avg_time_delta = pd.Timedelta(int(avg_period_ns), unit='ns')
+        avg_hours = avg_period_ns / NS_PER_HOUR
 
         # Adaptive parameters based on timeframe
         if avg_hours < 1.5:  # Minute data
@@ -218,19 +438,21 @@ def create_price_chart(df: pd.DataFrame, output_path: str = None, include_volume
         min_distance_hours = 24
         peak_window = 5
 
+    # pyplot is imported here so importing the package skips backend setup
+    import matplotlib.pyplot as plt
+
     # Set up dark theme style
     plt.style.use('dark_background')
-
     # Set up the figure - single plot if no volume, otherwise with volume subplot
     if include_volume:
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(16, 10),
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(16, 10), layout='constrained',
                                          gridspec_kw={'height_ratios': [3, 1]})
         fig.patch.set_facecolor('#0d1117')
         ax1.set_facecolor('#0d1117')
         ax2.set_facecolor('#0d1117')
     else:
         # Larger single chart without volume
-        fig, ax1 = plt.subplots(1, 1, figsize=(24, 12))
+        fig, ax1 = plt.subplots(1, 1, figsize=(24, 12), layout='constrained')
         fig.patch.set_facecolor('#0d1117')
         ax1.set_facecolor('#0d1117')
 
@@ -246,101 +468,92 @@ def create_price_chart(df: pd.DataFrame, output_path: str = None, include_volume
     fig.suptitle(f'ZERA Token - Complete Price History | {timeframe_label}',
                  fontsize=16, fontweight='bold', color='#c9d1d9')
 
-    # Color mapping for different pools
-    pool_colors = {
-        'mon3y': '#FF6B6B',      # Red for M0N3Y
-        'zera_Raydium': '#4ECDC4', # Teal for ZERA Raydium
-        'zera_Meteora': '#45B7D1'  # Blue for ZERA Meteora
-    }
-
     # Migration timestamps for filtering
-    migration_1 = datetime.fromtimestamp(config.MIGRATION_DATES['mon3y_to_zera'])
-    migration_2 = datetime.fromtimestamp(config.MIGRATION_DATES['zera_Raydium_to_Meteora'])
+    migration_1 = MIGRATION_DATETIMES['mon3y_to_zera']
+    migration_2 = MIGRATION_DATETIMES['zera_Raydium_to_Meteora']
+
+    # Cut off old pools BEFORE migration (new pools start AT migration):
+    # M0N3Y ends before ZERA Raydium starts, ZERA Raydium ends before Meteora starts.
+    # Meteora has no cutoff (it's current, starts at migration_2)
+    pool_cutoffs = {
+        'mon3y': migration_1.astype(np.int64),
+        'zera_Raydium': migration_2.astype(np.int64),
+    }
 
     # Plot 1: Candlestick chart
     # Plot each pool's real data as candlesticks
-    real_df = df[~df.get('is_interpolated', False)].copy()
+    # Split the real data by pool once; the candlestick and volume plots share it.
+    # Groups keep the date order, so each cutoff is a binary search on the dates
+    pool_frames = {}
+    for pool_name, pool_df in real_df.groupby('pool_name', observed=True, sort=False):
+        cutoff = pool_cutoffs.get(pool_name)
+        if cutoff is not None:
+            # Exclude the migration date itself
+            end = np.searchsorted(_dates_ns(pool_df['date']), cutoff, side='left')
+            pool_df = pool_df.iloc[:end]
+
+        pool_frames[pool_name] = pool_df
+
+    # Resolve each pool's color and label once for both subplot loops
+    pool_meta = [
+        (pool_name, pool_df, POOL_COLORS.get(pool_name, '#333333'),
+         SIMPLE_LABELS.get(pool_name, pool_name))
+        for pool_name, pool_df in pool_frames.items()
+        if len(pool_df) > 0
+    ]
+
+    # Detect each pool's peak/trough markers before any plotting
+    min_distance_days = min_distance_hours / 24
+    pool_markers = [
+        _pool_markers(pool_df, peak_window, min_distance_days)
+        for _, pool_df, _, _ in pool_meta
+    ]
 
     # Track which pools were plotted for legend
     plotted_pools = []
 
-    for pool_name in real_df['pool_name'].unique():
-        pool_df = real_df[real_df['pool_name'] == pool_name].copy()
-
-        # Cut off old pools BEFORE migration (new pools start AT migration)
-        if pool_name == 'mon3y':
-            # M0N3Y ends BEFORE ZERA Raydium starts (exclude migration date)
-            pool_df = pool_df[pool_df['date'] < migration_1]
-        elif pool_name == 'zera_Raydium':
-            # ZERA Raydium starts at migration_1, ends BEFORE Meteora starts
-            pool_df = pool_df[pool_df['date'] < migration_2]
-        # Meteora has no cutoff (it's current, starts at migration_2)
-
-        if len(pool_df) > 0:
-            # Plot candlesticks for this pool
-            plot_candlesticks(ax1, pool_df, color=pool_colors.get(pool_name, '#333333'), alpha=0.9)
-            plotted_pools.append((pool_name, pool_colors.get(pool_name, '#333333')))
-
-            # Find peaks and troughs using adaptive window
-            peaks = find_local_peaks(pool_df, window=peak_window, prominence_threshold=0.25)
-            troughs = find_local_troughs(pool_df, window=peak_window, prominence_threshold=0.25)
-
-            # Combine peaks and troughs with type markers
-            all_markers = []
-            for date, value in peaks:
-                all_markers.append((date, value, 'peak'))
-            for date, value in troughs:
-                all_markers.append((date, value, 'trough'))
-
-            # Filter combined list to prevent overlaps using adaptive distance
-            min_distance_days = min_distance_hours / 24
-            filtered_markers = filter_by_minimum_distance(all_markers, min_distance_days=min_distance_days)
-
-            # Plot filtered markers with side labels
-            for marker in filtered_markers:
-                date, value, marker_type = marker
-
-                if marker_type == 'peak':
-                    # Mark the peak with a small circle
-                    ax1.plot(date, value, 'o', color='#26a69a', markersize=6,
-                            markeredgecolor='white', markeredgewidth=1, zorder=11)
-
-                    # Position label using adaptive offset
-                    label_date = date + label_offset
-                    ax1.annotate(f'${value:.4f}',
-                               xy=(date, value),
-                               xytext=(label_date, value),
-                               fontsize=7, color='white', weight='bold',
-                               bbox=dict(boxstyle='round,pad=0.4', facecolor='#26a69a',
-                                        edgecolor='white', alpha=0.9, linewidth=1),
-                               ha='left', va='center',
-                               arrowprops=dict(arrowstyle='-', color='#26a69a',
-                                             lw=1, alpha=0.6),
-                               zorder=10)
-                else:  # trough
-                    # Mark the trough with a small circle
-                    ax1.plot(date, value, 'o', color='#ef5350', markersize=6,
-                            markeredgecolor='white', markeredgewidth=1, zorder=11)
-
-                    # Position label using adaptive offset
-                    label_date = date + label_offset
-                    ax1.annotate(f'${value:.4f}',
-                               xy=(date, value),
-                               xytext=(label_date, value),
-                               fontsize=7, color='white', weight='bold',
-                               bbox=dict(boxstyle='round,pad=0.4', facecolor='#ef5350',
-                                        edgecolor='white', alpha=0.9, linewidth=1),
-                               ha='left', va='center',
-                               arrowprops=dict(arrowstyle='-', color='#ef5350',
-                                             lw=1, alpha=0.6),
-                               zorder=10)
+    for pool_name, pool_df, color, label in pool_meta:
+        # Plot candlesticks for this pool
+        plot_candlesticks(ax1, pool_df, color=color, alpha=0.9)
+        plotted_pools.append((label, color))
+
+    # Plot filtered markers with side labels: the markers of every pool share
+    # one scatter and one leader-line collection per marker type, only the
+    # labels themselves are per-marker
+    all_markers = [marker for markers in pool_markers for marker in markers]
+    for marker_type, marker_color in (('peak', '#26a69a'), ('trough', '#ef5350')):
+        typed = [(date, value) for date, value, t in all_markers if t == marker_type]
+        if not typed:
+            continue
+
+        marker_dates = np.array([date for date, _ in typed], dtype='datetime64[ns]')
+        marker_values = np.array([value for _, value in typed], dtype=np.float64)
+        # Position labels using adaptive offset
+        label_dates = marker_dates + np.timedelta64(label_offset)
+
+        # Mark the extrema with small circles
+        ax1.scatter(marker_dates, marker_values, s=36, color=marker_color,
+                    edgecolors='white', linewidths=1, zorder=11)
+
+        leaders = np.empty((len(typed), 2, 2))
+        leaders[:, 0, 0] = mdates.date2num(marker_dates)
+        leaders[:, 1, 0] = mdates.date2num(label_dates)
+        leaders[:, :, 1] = marker_values[:, None]
+        ax1.add_collection(LineCollection(leaders, colors=marker_color, linewidths=1,
+                                          alpha=0.6, zorder=10), autolim=False)
+
+        for label_date, value in zip(label_dates, marker_values):
+            ax1.text(label_date, value, f'${value:.4f}',
+                     fontsize=7, color='white', weight='bold',
+                     bbox=dict(boxstyle='round,pad=0.4', facecolor=marker_color,
+                               edgecolor='white', alpha=0.9, linewidth=1),
+                     ha='left', va='center', zorder=10)
 
     # Label the absolute last candlestick (current price) - only once
-    last_row = real_df.iloc[-1]
-    last_date = last_row['date']
-    last_close = last_row['close']
-    last_high = last_row['high']
-    last_low = last_row['low']
+    last_date = real_df['date'].to_numpy()[-1]
+    last_close = real_df['close'].to_numpy()[-1]
+    last_high = real_df['high'].to_numpy()[-1]
+    last_low = real_df['low'].to_numpy()[-1]
 
     # Determine which value to mark (high or low based on close position)
     candle_range = last_high - last_low
@@ -377,38 +590,21 @@ def create_price_chart(df: pd.DataFrame, output_path: str = None, include_volume
                zorder=12)
 
     # Add migration markers with transition labels
-    for event_name, timestamp in config.MIGRATION_DATES.items():
-        migration_date = datetime.fromtimestamp(timestamp)
-        ax1.axvline(x=migration_date, color='#666666', linestyle='--',
-                   linewidth=1, alpha=0.6, zorder=0)
-
-        # Create transition label from event name
-        if 'mon3y_to_zera' in event_name:
-            label = 'MON3Y → Raydium'
-        elif 'Raydium_to_Meteora' in event_name:
-            label = 'Raydium → Meteora'
-        else:
-            label = event_name.replace('_', ' → ')
-
-        # Place label at top of chart, centered on line
-        ax1.text(migration_date, ax1.get_ylim()[1] * 0.98, label,
-                ha='center', va='top', fontsize=8, color='#8b949e',
-                bbox=dict(boxstyle='round,pad=0.3', facecolor='#161b22',
-                         edgecolor='#30363d', alpha=0.9, linewidth=0.5))
+    _add_migration_lines(ax1, color='#666666')
+
+    # Place labels at top of chart, centered on line
+    label_y = ax1.get_ylim()[1] * 0.98
+    for event_name, migration_date in MIGRATION_DATETIMES.items():
+        ax1.text(migration_date, label_y, MIGRATION_TRANSITION_LABELS[event_name],
+                 ha='center', va='top', fontsize=8, color='#8b949e',
+                 bbox=dict(boxstyle='round,pad=0.3', facecolor='#161b22',
+                           edgecolor='#30363d', alpha=0.9, linewidth=0.5))
 
     # Create custom legend with simple names
     legend_elements = []
 
-    # Simple label mapping
-    simple_labels = {
-        'mon3y': 'MON3Y',
-        'zera_Raydium': 'Raydium',
-        'zera_Meteora': 'Meteora'
-    }
-
     # Add legend entries for each plotted pool
-    for pool_name, color in plotted_pools:
-        label = simple_labels.get(pool_name, pool_name)
+    for label, color in plotted_pools:
         legend_elements.append(Line2D([0], [0], color=color, linewidth=8,
                                      label=label))
 
@@ -423,39 +619,34 @@ def create_price_chart(df: pd.DataFrame, output_path: str = None, include_volume
     plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45, ha='right')
 
     # Set x-axis limits with padding to ensure all data fits (including labels)
-    date_range = real_df['date'].max() - real_df['date'].min()
+    # (real_df is date-sorted, so the ends are plain datetime64 lookups)
+    first_date = real_df['date'].to_numpy()[0]
+    date_range = last_date - first_date
     left_padding = date_range * 0.02  # 2% padding on left
     # Right padding needs to account for label offset plus some extra space
-    right_padding = label_offset + (date_range * 0.05)
-    ax1.set_xlim(real_df['date'].min() - left_padding, real_df['date'].max() + right_padding)
+    right_padding = np.timedelta64(label_offset) + (date_range * 0.05)
+    x_limits = (first_date - left_padding, last_date + right_padding)
+    ax1.set_xlim(*x_limits)
 
     # Plot 2: Volume over time (only if include_volume is True)
     if include_volume:
-        # Only plot real data (skip interpolated points)
-        real_df_vol = df[~df.get('is_interpolated', False)].copy()
-
-        for pool_name in real_df_vol['pool_name'].unique():
-            pool_df = real_df_vol[real_df_vol['pool_name'] == pool_name].copy()
-
-            # Cut off old pools BEFORE migration (new pools start AT migration)
-            if pool_name == 'mon3y':
-                pool_df = pool_df[pool_df['date'] < migration_1]
-            elif pool_name == 'zera_Raydium':
-                pool_df = pool_df[pool_df['date'] < migration_2]
-
-            if len(pool_df) > 0:
-                label = simple_labels.get(pool_name, pool_name)
-                # Scale volume to millions
-                ax2.bar(pool_df['date'], pool_df['volume'] / 1_000_000,
-                       label=label,
-                       color=pool_colors.get(pool_name, '#333333'),
-                       alpha=0.6, width=0.8)
+        # Only plot real data (skip interpolated points), cut off at each migration;
+        # every pool's bars go through a single bar call, colored per pool
+        if pool_meta:
+            volume_frames = [pool_df for _, pool_df, _, _ in pool_meta]
+            volume_dates = np.concatenate([pool_df['date'].to_numpy()
+                                           for pool_df in volume_frames])
+            volumes = np.concatenate([pool_df['volume'].to_numpy()
+                                      for pool_df in volume_frames])
+            volume_colors = np.concatenate([np.full(len(pool_df), color)
+                                            for _, pool_df, color, _ in pool_meta])
+            # Scale volume to millions
+            ax2.bar(volume_dates, volumes / 1_000_000,
+                   color=volume_colors,
+                   alpha=0.6, width=0.8, rasterized=True)
 
         # Add migration markers to volume chart (matching price chart style)
-        for event_name, timestamp in config.MIGRATION_DATES.items():
-            migration_date = datetime.fromtimestamp(timestamp)
-            ax2.axvline(x=migration_date, color='#30363d', linestyle='--',
-                       linewidth=1, alpha=0.6, zorder=0)
+        _add_migration_lines(ax2, color='#30363d')
 
         ax2.set_xlabel('Date', fontsize=12, color='#c9d1d9')
         ax2.set_ylabel('Volume (Millions USD)', fontsize=12, color='#c9d1d9')
@@ -466,14 +657,15 @@ def create_price_chart(df: pd.DataFrame, output_path: str = None, include_volume
         plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45, ha='right')
 
         # Set x-axis limits to match price chart exactly
-        ax2.set_xlim(real_df['date'].min() - left_padding, real_df['date'].max() + right_padding)
+        ax2.set_xlim(*x_limits)
 
-    plt.tight_layout()
+    # Layout is handled by the constrained layout engine at draw time
 
     # Save or show
     if output_path:
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        plt.savefig(output_path, dpi=dpi or config.CHART_DPI, bbox_inches='tight',
+                    facecolor=fig.get_facecolor(), pil_kwargs=PNG_SAVE_KWARGS)
         print(f"\n✓ Chart saved to: {output_path}")
     else:
         plt.show()
@@ -481,21 +673,27 @@ def create_price_chart(df: pd.DataFrame, output_path: str = None, include_volume
     plt.close()
 
 
-def create_comparison_chart(df: pd.DataFrame, output_path: str = None):
+def create_comparison_chart(df: pd.DataFrame, output_path: str = None, dpi: int = None):
     """
     Create a comparison chart showing key metrics across pools
 
     Args:
         df: Unified DataFrame with price history
         output_path: Path to save the chart (optional)
+        dpi: Resolution of the saved chart (default: config.CHART_DPI)
     """
-    # Set up dark theme
-    plt.style.use('dark_background')
-
     # Filter out interpolated data for accurate statistics
-    real_df = df[~df.get('is_interpolated', False)].copy()
+    real_df = _real_rows(df)
+    if real_df.empty:
+        # Nothing to compare - skip figure construction entirely
+        print("Warning: No real data points to chart, skipping comparison chart")
+        return
+
+    import matplotlib.pyplot as plt
 
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+    # Set up dark theme
+    plt.style.use('dark_background')
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10), layout='constrained')
     fig.patch.set_facecolor('#0d1117')
     for ax in [ax1, ax2, ax3, ax4]:
         ax.set_facecolor('#0d1117')
@@ -503,20 +701,21 @@ def create_comparison_chart(df: pd.DataFrame, output_path: str = None):
     fig.suptitle('ZERA Token - Pool Comparison Metrics',
                  fontsize=16, fontweight='bold', color='#c9d1d9')
 
-    pool_colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
+    # All four panels come from a single pass over the pool groups
+    stats = real_df.groupby('pool_name', observed=True).agg(
+        avg=('close', 'mean'),
+        tot_vol=('volume', 'sum'),
+        vol=('close', 'std'),
+        n=('close', 'size'),
+    )
 
-    # Simple label mapping
-    simple_labels = {
-        'mon3y': 'MON3Y',
-        'zera_Raydium': 'Raydium',
-        'zera_Meteora': 'Meteora'
-    }
+    pool_labels = [SIMPLE_LABELS.get(p, p) for p in stats.index]
 
     # 1. Average Price by Pool
-    avg_prices = real_df.groupby('pool_name')['close'].mean()
-    ax1.bar(range(len(avg_prices)), avg_prices.values, color=pool_colors)
+    avg_prices = stats['avg']
+    ax1.bar(range(len(avg_prices)), avg_prices.values, color=COMPARISON_BAR_COLORS)
     ax1.set_xticks(range(len(avg_prices)))
-    ax1.set_xticklabels([simple_labels.get(p, p) for p in avg_prices.index],
+    ax1.set_xticklabels(pool_labels,
                          rotation=15, ha='right', color='#c9d1d9')
     ax1.set_ylabel('Average Price (USD)', color='#c9d1d9')
     ax1.set_title('Average Price by Pool', color='#c9d1d9')
@@ -524,10 +723,10 @@ def create_comparison_chart(df: pd.DataFrame, output_path: str = None):
     ax1.tick_params(colors='#8b949e', which='both')
 
     # 2. Total Volume by Pool
-    total_volumes = real_df.groupby('pool_name')['volume'].sum()
-    ax2.bar(range(len(total_volumes)), total_volumes.values, color=pool_colors)
+    total_volumes = stats['tot_vol']
+    ax2.bar(range(len(total_volumes)), total_volumes.values, color=COMPARISON_BAR_COLORS)
     ax2.set_xticks(range(len(total_volumes)))
-    ax2.set_xticklabels([simple_labels.get(p, p) for p in total_volumes.index],
+    ax2.set_xticklabels(pool_labels,
                          rotation=15, ha='right', color='#c9d1d9')
     ax2.set_ylabel('Total Volume (USD)', color='#c9d1d9')
     ax2.set_title('Total Volume by Pool', color='#c9d1d9')
@@ -535,10 +734,10 @@ def create_comparison_chart(df: pd.DataFrame, output_path: str = None):
     ax2.tick_params(colors='#8b949e', which='both')
 
     # 3. Price Volatility (std dev) by Pool
-    volatility = real_df.groupby('pool_name')['close'].std()
-    ax3.bar(range(len(volatility)), volatility.values, color=pool_colors)
+    volatility = stats['vol']
+    ax3.bar(range(len(volatility)), volatility.values, color=COMPARISON_BAR_COLORS)
     ax3.set_xticks(range(len(volatility)))
-    ax3.set_xticklabels([simple_labels.get(p, p) for p in volatility.index],
+    ax3.set_xticklabels(pool_labels,
                          rotation=15, ha='right', color='#c9d1d9')
     ax3.set_ylabel('Price Std Dev (USD)', color='#c9d1d9')
     ax3.set_title('Price Volatility by Pool', color='#c9d1d9')
@@ -546,22 +745,23 @@ def create_comparison_chart(df: pd.DataFrame, output_path: str = None):
     ax3.tick_params(colors='#8b949e', which='both')
 
     # 4. Days Active by Pool
-    days_active = real_df.groupby('pool_name').size()
-    ax4.bar(range(len(days_active)), days_active.values, color=pool_colors)
+    days_active = stats['n']
+    ax4.bar(range(len(days_active)), days_active.values, color=COMPARISON_BAR_COLORS)
     ax4.set_xticks(range(len(days_active)))
-    ax4.set_xticklabels([simple_labels.get(p, p) for p in days_active.index],
+    ax4.set_xticklabels(pool_labels,
                          rotation=15, ha='right', color='#c9d1d9')
     ax4.set_ylabel('Days', color='#c9d1d9')
     ax4.set_title('Days Active by Pool', color='#c9d1d9')
     ax4.grid(True, alpha=0.15, axis='y', color='#30363d', linewidth=0.5)
     ax4.tick_params(colors='#8b949e', which='both')
 
-    plt.tight_layout()
+    # Layout is handled by the constrained layout engine at draw time
 
     # Save or show
     if output_path:
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        plt.savefig(output_path, dpi=dpi or config.CHART_DPI, bbox_inches='tight',
+                    facecolor=fig.get_facecolor(), pil_kwargs=PNG_SAVE_KWARGS)
         print(f"✓ Comparison chart saved to: {output_path}")
     else:
         plt.show()